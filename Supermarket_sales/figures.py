@@ -0,0 +1,292 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import hashlib
+import threading
+
+from loguru import logger
+import pandas as pd
+import plotly.express as px
+
+
+@dataclass(frozen=True)
+class FigureSpec:
+    """A dashboard figure: its heading, captions and a builder over df_selection."""
+
+    fig_id: str
+    subheader: str
+    build: Callable[[pd.DataFrame], object]
+    captions: tuple = field(default_factory=tuple)
+
+
+def _sales_by_gender_payment(df):
+    data = df.groupby(["Gender", "Payment"])["Total"].sum().reset_index()
+    return px.bar(
+        data,
+        x="Gender",
+        y="Total",
+        color="Payment",
+        barmode="group",
+        title="Total Sales by Gender and Payment",
+        labels={"Total": "Total Sales"},
+        template="plotly_white",
+    )
+
+
+def _branch_product_sales(df):
+    data = df.groupby(["Branch", "Product line"])["Total"].sum().reset_index()
+    return px.bar(
+        data,
+        x="Branch",
+        y="Total",
+        color="Product line",
+        title="Branch-wise Product Line Sales",
+        labels={"Total": "Total Sales"},
+        template="plotly_white",
+    )
+
+
+def _city_customer_sales(df):
+    data = df.groupby(["City", "Customer_type"])["Total"].sum().reset_index()
+    return px.bar(
+        data,
+        x="City",
+        y="Total",
+        color="Customer_type",
+        barmode="group",
+        title="City-wise Sales by Customer Type",
+        labels={"Total": "Total Sales"},
+        template="plotly_white",
+    )
+
+
+def _hourly_sales(df):
+    data = df.groupby("hour")["Total"].sum().reset_index()
+    return px.line(
+        data,
+        x="hour",
+        y="Total",
+        markers=True,
+        title="Sales by Hour of Day",
+        labels={"Total": "Total Sales", "hour": "Hour"},
+        template="plotly_white",
+    )
+
+
+def _product_sales(df):
+    data = df.groupby("Product line")["Total"].sum().reset_index()
+    return px.bar(
+        data,
+        x="Product line",
+        y="Total",
+        title="Total Sales per Product Line",
+        labels={"Total": "Total Sales"},
+        template="plotly_white",
+    )
+
+
+def _gender_quantity(df):
+    data = df.groupby("Gender")["Quantity"].sum().reset_index()
+    return px.pie(
+        data,
+        names="Gender",
+        values="Quantity",
+        title="Quantity Sold by Gender",
+        template="plotly_white",
+    )
+
+
+def _product_quantity(df):
+    data = df.groupby("Product line")["Quantity"].sum().reset_index()
+    return px.bar(
+        data,
+        x="Product line",
+        y="Quantity",
+        title="Total Quantity Sold per Product Line",
+        labels={"Quantity": "Quantity"},
+        template="plotly_white",
+    )
+
+
+def _product_rating(df):
+    data = df.groupby("Product line")["Rating"].mean().reset_index()
+    return px.bar(
+        data,
+        x="Product line",
+        y="Rating",
+        title="Average Rating per Product Line",
+        labels={"Rating": "Average Rating"},
+        template="plotly_white",
+    )
+
+
+def _gender_tax(df):
+    data = df.groupby("Gender")["Tax 5%"].mean().reset_index()
+    return px.bar(
+        data,
+        x="Gender",
+        y="Tax 5%",
+        title="Average Tax Paid by Gender",
+        labels={"Tax 5%": "Avg Tax"},
+        template="plotly_white",
+    )
+
+
+def _product_tax(df):
+    data = df.groupby("Product line")["Tax 5%"].mean().reset_index()
+    return px.bar(
+        data,
+        x="Product line",
+        y="Tax 5%",
+        title="Average Tax Paid by Product Line",
+        labels={"Tax 5%": "Avg Tax"},
+        template="plotly_white",
+    )
+
+
+def _product_gross_income(df):
+    data = df.groupby("Product line")["gross income"].mean().reset_index()
+    return px.bar(
+        data,
+        x="Product line",
+        y="gross income",
+        title="Avg Gross Income per Product Line",
+        labels={"gross income": "Gross Income"},
+        template="plotly_white",
+    )
+
+
+FIGURES = [
+    FigureSpec(
+        "fig1",
+        "Sales by Gender & Payment Method",
+        _sales_by_gender_payment,
+        (
+            "This chart shows the total sales by Gender and payment",
+            "Females generally spend more than men and they make more cash payments as well",
+        ),
+    ),
+    FigureSpec(
+        "fig2",
+        "Branch vs Product Line Sales",
+        _branch_product_sales,
+        ("From the chart we can see that branch C brings in more sales than the other branches",),
+    ),
+    FigureSpec(
+        "fig3",
+        "City & Customer Type Sales",
+        _city_customer_sales,
+        (
+            (
+                "We can also observe that the Members typically bring in more sales than the "
+                "normal customers"
+            ),
+        ),
+    ),
+    FigureSpec(
+        "fig4",
+        "Hourly Sales Trend",
+        _hourly_sales,
+        (
+            (
+                "We observe that at midday we have a significant drop in sales which then "
+                "picks up in the evening hours"
+            ),
+        ),
+    ),
+    FigureSpec(
+        "fig5",
+        "Sales per Product Line",
+        _product_sales,
+        ("Food and beverages have the most sales in comparison to the health and Beauty",),
+    ),
+    FigureSpec(
+        "fig6",
+        "Quantity by Gender",
+        _gender_quantity,
+        ("Females have a high quantity threshold in comparison to males",),
+    ),
+    FigureSpec("fig7", "Quantity by Product Line", _product_quantity),
+    FigureSpec(
+        "fig8",
+        "Average Rating by Product Line",
+        _product_rating,
+        ("We maintain general user satisfaction on all the products",),
+    ),
+    FigureSpec(
+        "fig9",
+        "Average Tax by Gender",
+        _gender_tax,
+        ("Females may be in a higher tax bracket compared to males",),
+    ),
+    FigureSpec(
+        "fig10",
+        "Average Tax by Product Line",
+        _product_tax,
+        (
+            (
+                "We observe that the home and lifestyle category under products is taxed slightly "
+                "higher while fashion is lower"
+            ),
+        ),
+    ),
+    FigureSpec("fig11", "Average Gross Income by Product Line", _product_gross_income),
+]
+FIGURES_BY_ID = {spec.fig_id: spec for spec in FIGURES}
+
+
+def data_key(df: pd.DataFrame) -> str:
+    """
+    Return a digest of the rows and columns of df.
+
+    Filter selections that yield the same rows share a key, and reloaded data
+    gets a new one.
+    """
+    digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """
+    Bounded LRU of plotly figures keyed by (data_key, fig_id).
+
+    Missing figures are built one after another on the calling thread, since
+    plotly express construction is pure Python under the GIL. A cache hit
+    skips the groupby and figure construction; Streamlit still serializes
+    the figure on each render.
+
+    The returned figures are shared by every session, so callers must not
+    mutate them (e.g. with update_layout); copy with go.Figure(fig) first.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._figures: OrderedDict = OrderedDict()
+
+    def get_many(self, fig_ids, df: pd.DataFrame) -> dict:
+        """
+        Return {fig_id: figure} for fig_ids over df, building only uncached ones.
+        """
+        key = data_key(df)
+        found = {}
+        with self._lock:
+            for fig_id in fig_ids:
+                if (key, fig_id) in self._figures:
+                    self._figures.move_to_end((key, fig_id))
+                    found[fig_id] = self._figures[(key, fig_id)]
+        missing = [fig_id for fig_id in fig_ids if fig_id not in found]
+
+        if missing:
+            logger.debug(f"Building {len(missing)} figure(s): {missing}")
+            built = {fig_id: FIGURES_BY_ID[fig_id].build(df) for fig_id in missing}
+            with self._lock:
+                for fig_id, fig in built.items():
+                    self._figures[(key, fig_id)] = fig
+                    self._figures.move_to_end((key, fig_id))
+                while len(self._figures) > self.maxsize:
+                    self._figures.popitem(last=False)
+            found.update(built)
+
+        return {fig_id: found[fig_id] for fig_id in fig_ids}
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+import hashlib
+import io
+import os
+from pathlib import Path
+import threading
+
+import joblib
+from loguru import logger
+import numpy as np
+import pandas as pd
+
+
+def row_keys(X: pd.DataFrame) -> np.ndarray:
+    """
+    Hash every encoded feature row of X into a string key.
+
+    The column layout is folded into each key, so the same values under a
+    different encoding never share an entry.
+    """
+    columns = hashlib.sha256("\x1f".join(map(str, X.columns)).encode()).hexdigest()[:16]
+    hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+    return np.array([f"{columns}:{h:016x}" for h in hashes])
+
+
+class CachedModel:
+    """
+    Memoizing wrapper around a joblib model artifact.
+
+    Predictions are kept in a bounded in-memory LRU and, when cache_dir is
+    given, in one .npz store of row keys and predictions per artifact digest,
+    read once per batch and rewritten with the batch's new rows. The store is
+    capped at max_disk_entries, keeping the most recently written rows.
+    Retraining the model invalidates every cached prediction and deletes the
+    stores of older digests.
+
+    hits and misses count rows: a miss is a row actually sent to the model.
+    """
+
+    def __init__(
+        self,
+        model_path: Path,
+        maxsize: int = 4096,
+        cache_dir: Path | None = None,
+        max_disk_entries: int = 1_000_000,
+    ):
+        self.model_path = Path(model_path)
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory: OrderedDict = OrderedDict()
+        self._stat = None
+        self._load()
+
+    def _load(self) -> None:
+        # Hash and unpickle the same bytes so a model is never cached under another
+        # version's digest; stat first so a rewrite during the read triggers a reload.
+        stat = self.model_path.stat()
+        data = self.model_path.read_bytes()
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.model = joblib.load(io.BytesIO(data))
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        self._memory.clear()
+        logger.info(f"Loaded {self.model_path.name} (sha256 {self.digest[:12]})")
+        if self.cache_dir is not None:
+            self._drop_stale_stores()
+
+    def _drop_stale_stores(self) -> None:
+        """Delete prediction stores left behind by earlier versions of the artifact."""
+        current = self._store_path()
+        for path in self.cache_dir.glob(f"{self.model_path.stem}-*.npz"):
+            digest = path.stem[len(self.model_path.stem) + 1 :]
+            is_store = len(digest) == 16 and all(c in "0123456789abcdef" for c in digest)
+            if is_store and path != current:
+                path.unlink()
+                logger.debug(f"Removed stale prediction store {path.name}")
+
+    def _refresh(self) -> None:
+        """Reload the model and drop the memory cache if the artifact changed."""
+        stat = self.model_path.stat()
+        if (stat.st_mtime_ns, stat.st_size) != self._stat:
+            logger.info(f"{self.model_path.name} changed on disk, invalidating prediction cache")
+            self._load()
+
+    def _store_path(self) -> Path:
+        return self.cache_dir / f"{self.model_path.stem}-{self.digest[:16]}.npz"
+
+    def _read_store(self) -> tuple[np.ndarray, np.ndarray]:
+        path = self._store_path()
+        if not path.exists():
+            return np.empty(0, dtype="S"), np.empty(0)
+        with np.load(path) as store:
+            return store["keys"], store["values"]
+
+    def _write_store(self, keys: np.ndarray, values: np.ndarray) -> None:
+        # Another process may have written the same rows; keep the latest copy
+        latest = ~pd.Index(keys).duplicated(keep="last")
+        keys, values = keys[latest], values[latest]
+        keys, values = keys[-self.max_disk_entries :], values[-self.max_disk_entries :]
+        path = self._store_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, keys=keys, values=values)
+        os.replace(tmp, path)
+
+    def _remember(self, key: str, value) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Predict X, scoring each distinct uncached row exactly once.
+        """
+        keys = row_keys(X)
+        codes, unique_keys = pd.factorize(keys)
+        first_rows = np.unique(codes, return_index=True)[1]
+
+        with self._lock:
+            self._refresh()
+            values = [None] * len(unique_keys)
+            missing = []
+            for i, key in enumerate(unique_keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    values[i] = self._memory[key]
+                else:
+                    missing.append(i)
+            missing = np.asarray(missing, dtype=int)
+
+            if self.cache_dir is not None and missing.size:
+                stored_keys, stored_values = self._read_store()
+                positions = pd.Index(stored_keys).get_indexer(unique_keys[missing].astype("S"))
+                found = positions >= 0
+                for i, value in zip(missing[found], stored_values[positions[found]], strict=True):
+                    values[i] = value
+                    self._remember(unique_keys[i], value)
+                missing = missing[~found]
+
+            # Per row: only the first occurrence of an uncached row reaches the model
+            self.hits += len(codes) - len(missing)
+            self.misses += len(missing)
+
+            if missing.size:
+                predictions = np.asarray(self.model.predict(X.iloc[first_rows[missing]]))
+                for i, value in zip(missing, predictions, strict=True):
+                    values[i] = value
+                    self._remember(unique_keys[i], value)
+                if self.cache_dir is not None:
+                    new_keys = unique_keys[missing].astype("S")
+                    if stored_keys.size:
+                        new_keys = np.concatenate([stored_keys, new_keys])
+                        predictions = np.concatenate([stored_values, predictions])
+                    self._write_store(new_keys, predictions)
+
+        return np.asarray(values)[codes]
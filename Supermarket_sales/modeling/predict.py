@@ -1,10 +1,11 @@
 from pathlib import Path
-import joblib
+
+from loguru import logger
 import pandas as pd
 import typer
-from loguru import logger
 
 from Supermarket_sales.config import MODELS_DIR, PROCESSED_DATA_DIR
+from Supermarket_sales.modeling.cache import CachedModel
 
 app = typer.Typer()
 
@@ -15,36 +16,43 @@ def main(
     regression_model_path: Path = MODELS_DIR / "Random_forest_regression_model.pkl",
     classification_model_path: Path = MODELS_DIR / "Random_forest_classifier_model.pkl",
     predictions_path: Path = PROCESSED_DATA_DIR / "test_predictions.csv",
+    cache_dir: Path | None = None,
 ):
     """
     Load trained models, generate predictions, and save results for evaluation & visualization.
+
+    Duplicate feature rows are scored once; pass --cache-dir to reuse predictions across runs.
     """
     logger.info(f"📂 Loading features from {features_path}")
     df = pd.read_csv(features_path)
-    
-    target_cols = [col for col in ['Target_Total', 'HighSpender'] if col in df.columns]
+
+    target_cols = [col for col in ["Target_Total", "HighSpender"] if col in df.columns]
     X = df.drop(columns=target_cols, errors="ignore")
 
     logger.info("🧠 Loading models...")
-    reg_model = joblib.load(regression_model_path)
-    clf_model = joblib.load(classification_model_path)
+    reg_model = CachedModel(regression_model_path, cache_dir=cache_dir)
+    clf_model = CachedModel(classification_model_path, cache_dir=cache_dir)
 
     logger.info("🔮 Generating predictions...")
     y_reg_pred = reg_model.predict(X)
     y_clf_pred = clf_model.predict(X)
+    logger.info(
+        f"Prediction cache: {reg_model.hits + clf_model.hits} rows reused, "
+        f"{reg_model.misses + clf_model.misses} rows scored"
+    )
 
     logger.info(f"💾 Saving predictions to {predictions_path}")
     df_predictions = df.copy()
 
     # Include true targets if they exist
-    if 'Target_Total' in df.columns:
-        df_predictions['Target_Total'] = df['Target_Total']
-    if 'HighSpender' in df.columns:
-        df_predictions['HighSpender'] = df['HighSpender']
+    if "Target_Total" in df.columns:
+        df_predictions["Target_Total"] = df["Target_Total"]
+    if "HighSpender" in df.columns:
+        df_predictions["HighSpender"] = df["HighSpender"]
 
     # Add predictions
-    df_predictions['Predicted_Total'] = y_reg_pred
-    df_predictions['Predicted_HighSpender'] = y_clf_pred
+    df_predictions["Predicted_Total"] = y_reg_pred
+    df_predictions["Predicted_HighSpender"] = y_clf_pred
 
     df_predictions.to_csv(predictions_path, index=False)
 
@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Annotated
+
+from loguru import logger
+import pandas as pd
+from tqdm import tqdm
+import typer
+
+from Supermarket_sales.config import PROCESSED_DATA_DIR
+from Supermarket_sales.stats import KPI_COLUMNS, KPIStats, compute_kpis
+
+app = typer.Typer()
+
+
+def partition_kpis(input_path: Path, chunksize: int) -> KPIStats:
+    """
+    Stream one CSV partition in chunks and return its partial KPIStats.
+    """
+    chunks = pd.read_csv(input_path, usecols=KPI_COLUMNS, chunksize=chunksize)
+    return compute_kpis(chunks)
+
+
+@app.command()
+def main(
+    input_paths: Annotated[list[Path] | None, typer.Argument()] = None,
+    output_path: Path | None = None,
+    chunksize: int = 100_000,
+    workers: int = 1,
+):
+    """
+    Compute KPI statistics in one streaming pass over one or more sales CSV partitions.
+
+    Each partition is reduced to its own KPIStats (on up to --workers processes)
+    and the partial results are merged. Defaults to the processed Sales.csv.
+    """
+    input_paths = input_paths or [PROCESSED_DATA_DIR / "Sales.csv"]
+    for input_path in input_paths:
+        if not input_path.exists():
+            logger.error(f"Input file not found: {input_path}")
+            raise FileNotFoundError(f"Missing input file at {input_path}")
+
+    logger.info(f"📂 Streaming {len(input_paths)} partition(s) in chunks of {chunksize:,} rows")
+    reduce_partition = partial(partition_kpis, chunksize=chunksize)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(
+                tqdm(
+                    pool.map(reduce_partition, input_paths),
+                    total=len(input_paths),
+                    desc="Partitions",
+                )
+            )
+    else:
+        partials = [reduce_partition(path) for path in tqdm(input_paths, desc="Partitions")]
+
+    stats, *rest = partials
+    for part in rest:
+        stats.merge(part)
+    summary = stats.summary()
+
+    logger.info(f"\n{summary.to_string(float_format='{:,.2f}'.format)}")
+
+    if output_path is not None:
+        summary.to_csv(output_path, index_label="column")
+        logger.success(f"KPI report saved to {output_path}")
+
+
+if __name__ == "__main__":
+    app()
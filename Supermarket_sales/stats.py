@@ -0,0 +1,229 @@
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+KPI_COLUMNS = ["Total", "Quantity", "Rating"]
+
+
+class RunningStats:
+    """
+    One-pass count, sum, mean and variance (Welford/Chan).
+
+    Chunks are folded in with the parallel update formula, so partial
+    results from separate workers can be combined with merge().
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _combine(self, count, total, mean, m2, lo, hi) -> None:
+        if count == 0:
+            return
+        n = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / n
+        self.m2 += m2 + delta**2 * self.count * count / n
+        self.count = n
+        self.total += total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+
+    def update(self, values) -> "RunningStats":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            mean = values.mean()
+            self._combine(
+                values.size,
+                values.sum(),
+                mean,
+                ((values - mean) ** 2).sum(),
+                values.min(),
+                values.max(),
+            )
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        self._combine(other.count, other.total, other.mean, other.m2, other.min, other.max)
+        return self
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1), matching pandas."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float("nan")
+
+
+class TDigest:
+    """
+    Mergeable quantile sketch (merging t-digest with the arcsine scale).
+
+    While it has seen at most max_distinct distinct values it keeps exact
+    value counts, so quantiles match np.quantile; small discrete columns such
+    as Quantity never leave this mode. Past that it spills into weighted
+    centroids, compressed so that no centroid spans more than one unit of
+    k-space, which keeps the tails (e.g. p95) accurate in bounded memory.
+    """
+
+    def __init__(
+        self, compression: float = 100, max_distinct: int = 10_000, buffer_size: int = 10_000
+    ):
+        self.compression = compression
+        self.max_distinct = max_distinct
+        self.buffer_size = buffer_size
+        self.exact = True
+        self.values = np.empty(0)
+        self.counts = np.empty(0)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+        self._buffered_means = []
+        self._buffered_weights = []
+        self._buffered = 0
+
+    def _add_exact(self, values: np.ndarray, counts: np.ndarray) -> None:
+        unique, inverse = np.unique(np.r_[self.values, values], return_inverse=True)
+        self.values = unique
+        self.counts = np.bincount(inverse, weights=np.r_[self.counts, counts])
+        if self.values.size > self.max_distinct:
+            self.exact = False
+            self._add(self.values, self.counts)
+            self.values, self.counts = np.empty(0), np.empty(0)
+
+    def _add(self, means: np.ndarray, weights: np.ndarray) -> None:
+        self._buffered_means.append(means)
+        self._buffered_weights.append(weights)
+        self._buffered += means.size
+        if self._buffered >= self.buffer_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffered:
+            return
+        means = np.concatenate([self.means, *self._buffered_means])
+        weights = np.concatenate([self.weights, *self._buffered_weights])
+        self._buffered_means, self._buffered_weights, self._buffered = [], [], 0
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        q = (cumulative - weights / 2) / cumulative[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+        groups = np.floor(k - k[0]).astype(int)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    @property
+    def count(self) -> float:
+        if self.exact:
+            return float(self.counts.sum())
+        return float(self.weights.sum() + sum(w.sum() for w in self._buffered_weights))
+
+    def update(self, values) -> "TDigest":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+            if self.exact:
+                self._add_exact(*np.unique(values, return_counts=True))
+            else:
+                self._add(values, np.ones_like(values))
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        if not other.count:
+            return self
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if self.exact and other.exact:
+            self._add_exact(other.values, other.counts)
+            return self
+        if self.exact:
+            self.exact = False
+            self._add(self.values, self.counts)
+            self.values, self.counts = np.empty(0), np.empty(0)
+        if other.exact:
+            self._add(other.values, other.counts)
+        else:
+            other._compress()
+            self._add(other.means, other.weights)
+        return self
+
+    def quantile(self, q: float) -> float:
+        if self.exact:
+            if not self.values.size:
+                return float("nan")
+            # Linear interpolation between order statistics, as np.quantile does
+            cumulative = np.cumsum(self.counts)
+            rank = q * (cumulative[-1] - 1)
+            lo, hi = np.searchsorted(cumulative, [np.floor(rank), np.ceil(rank)], side="right")
+            return float(
+                self.values[lo] + (self.values[hi] - self.values[lo]) * (rank - np.floor(rank))
+            )
+        self._compress()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        total = self.weights.sum()
+        return float(
+            np.interp(q * total, np.r_[0.0, centers, total], np.r_[self.min, self.means, self.max])
+        )
+
+
+class KPIStats:
+    """
+    Streaming KPIs (count, sum, mean, std, median, p95) for the KPI columns.
+
+    Feed it DataFrame chunks with update(); combine partial results from
+    workers with merge().
+    """
+
+    def __init__(self, columns=KPI_COLUMNS, compression: float = 100):
+        self.columns = list(columns)
+        self.moments = {col: RunningStats() for col in self.columns}
+        self.digests = {col: TDigest(compression) for col in self.columns}
+
+    def update(self, chunk: pd.DataFrame) -> "KPIStats":
+        for col in self.columns:
+            values = pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype=float)
+            self.moments[col].update(values)
+            self.digests[col].update(values)
+        return self
+
+    def merge(self, other: "KPIStats") -> "KPIStats":
+        for col in self.columns:
+            self.moments[col].merge(other.moments[col])
+            self.digests[col].merge(other.digests[col])
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """One row per KPI column with count, sum, mean, std, median and p95."""
+        rows = {
+            col: {
+                "count": self.moments[col].count,
+                "sum": self.moments[col].total,
+                "mean": self.moments[col].mean if self.moments[col].count else float("nan"),
+                "std": self.moments[col].std,
+                "median": self.digests[col].quantile(0.5),
+                "p95": self.digests[col].quantile(0.95),
+            }
+            for col in self.columns
+        }
+        return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def compute_kpis(chunks: Iterable[pd.DataFrame], columns=KPI_COLUMNS) -> KPIStats:
+    """
+    Compute KPIs in one pass over an iterable of DataFrame chunks.
+    """
+    stats = KPIStats(columns)
+    for chunk in chunks:
+        stats.update(chunk)
+    return stats
@@ -1,9 +1,10 @@
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 from pathlib import Path
-import joblib
 from Supermarket_sales.config import PROCESSED_DATA_DIR, MODELS_DIR  # ✅ Added MODEL_DIR import
+from Supermarket_sales.figures import FIGURES, FigureCache
+from Supermarket_sales.modeling.cache import CachedModel
+from Supermarket_sales.stats import compute_kpis
 
 # Set page configuration
 st.set_page_config(page_title='Sales dashboard',
@@ -33,6 +34,16 @@ def load_data():
 
     return df
 
+@st.cache_resource
+def load_model(model_path):
+    """Loads a model once per server process and memoizes its predictions."""
+    return CachedModel(model_path)
+
+@st.cache_resource
+def load_figure_cache():
+    """Shares built figures across reruns and sessions."""
+    return FigureCache()
+
 df = load_data()
 
 page = st.sidebar.radio("Choose preferred section: ", ["EDA", "Feature Insights/KPI", 'Visualizations', "ML Predictions"])
@@ -106,11 +117,12 @@ if page == 'EDA':
 
 elif page == 'Feature Insights/KPI':
     st.title("Feature Insights & KPIs")
-    # KPIs
-    total_sales = df_selection['Total'].sum()
-    avg_rating = round(df_selection['Rating'].mean(), 1)
+    # KPIs (streaming statistics, so the same code works over chunked data)
+    kpis = compute_kpis([df_selection]).summary()
+    total_sales = kpis.loc['Total', 'sum']
+    avg_rating = round(kpis.loc['Rating', 'mean'], 1)
     star_rating = ":star:" * int(round(avg_rating))
-    avg_sale = round(df_selection['Total'].mean(), 2)
+    avg_sale = round(kpis.loc['Total', 'mean'], 2)
 
     left_column, middle_column, right_column = st.columns(3)
     with left_column:
@@ -123,6 +135,14 @@ elif page == 'Feature Insights/KPI':
         st.subheader("Average Sale per Transaction:")
         st.subheader(f"US $ {avg_sale}")
 
+    left_column, right_column = st.columns(2)
+    with left_column:
+        st.subheader("Median Basket Size:")
+        st.subheader(f"{kpis.loc['Quantity', 'median']:.1f} items")
+    with right_column:
+        st.subheader("95th Percentile Basket Size:")
+        st.subheader(f"{kpis.loc['Quantity', 'p95']:.1f} items")
+
     st.markdown("---")
 
     # Grouped statistics
@@ -158,132 +178,18 @@ elif page == 'Feature Insights/KPI':
 
 elif page == 'Visualizations':
     st.title("Visualizations")
+    st.caption("Toggle a chart to build it; charts are cached per filtered dataset.")
 
-    # ✅ Redefine group data to avoid NameError
-    group_gender_payment = df_selection.groupby(['Gender', 'Payment'])['Total'].sum().reset_index()
-    group_branch_product = df_selection.groupby(['Branch', 'Product line'])['Total'].sum().reset_index()
-    group_city_customer = df_selection.groupby(['City', 'Customer_type'])['Total'].sum().reset_index()
-    group_hour = df_selection.groupby('hour')['Total'].sum().reset_index()
-    group_product = df_selection.groupby('Product line')['Total'].sum().reset_index()
-    group_gender_quantity = df_selection.groupby('Gender')['Quantity'].sum().reset_index()
-    group_product_line_quantity = df_selection.groupby('Product line')['Quantity'].sum().reset_index()
-    group_rating_per_products = df_selection.groupby('Product line')['Rating'].mean().reset_index()
-    group_taxes_per_gender = df_selection.groupby('Gender')['Tax 5%'].mean().reset_index()
-    group_taxes_per_product_line = df_selection.groupby('Product line')['Tax 5%'].mean().reset_index()
-    group_products_per_gross_income = df_selection.groupby('Product line')['gross income'].mean().reset_index()
+    # Only figures toggled on are built; they are reused across reruns and sessions
+    shown = [spec for i, spec in enumerate(FIGURES)
+             if st.toggle(spec.subheader, value=i < 3, key=f"show_{spec.fig_id}")]
+    figures = load_figure_cache().get_many([spec.fig_id for spec in shown], df_selection)
 
-    # Plots
-    st.subheader("Sales by Gender & Payment Method")
-    fig1 = px.bar(group_gender_payment,
-                x="Gender",
-                y="Total",
-                color="Payment",
-                barmode="group",
-                title="Total Sales by Gender and Payment",
-                labels={"Total": "Total Sales"},
-                template="plotly_white")
-    st.plotly_chart(fig1, use_container_width=True)
-    st.caption('This chart shows the total sales by Gender and payment')
-    st.caption('Females generally spend more than men and they make more cash payments as well')
-
-    st.subheader("Branch vs Product Line Sales")
-    fig2 = px.bar(group_branch_product,
-                x="Branch",
-                y="Total",
-                color="Product line",
-                title="Branch-wise Product Line Sales",
-                labels={"Total": "Total Sales"},
-                template="plotly_white")
-    st.plotly_chart(fig2, use_container_width=True)
-    st.caption('From the chart we can see that branch C brings in more sales than the other branches')
-
-    st.subheader("City & Customer Type Sales")
-    fig3 = px.bar(group_city_customer,
-                x="City",
-                y="Total",
-                color="Customer_type",
-                barmode="group",
-                title="City-wise Sales by Customer Type",
-                labels={"Total": "Total Sales"},
-                template="plotly_white")
-    st.plotly_chart(fig3, use_container_width=True)
-    st.caption('We can also observe that the Members typically bring in more sales than the normal customers')
-
-    st.subheader("Hourly Sales Trend")
-    fig4 = px.line(group_hour,
-                x="hour",
-                y="Total",
-                markers=True,
-                title="Sales by Hour of Day",
-                labels={"Total": "Total Sales", "hour": "Hour"},
-                template="plotly_white")
-    st.plotly_chart(fig4, use_container_width=True)
-    st.caption('We observe that at midday we have a significant drop in sales which then picks up in the evening hours')
-
-    st.subheader("Sales per Product Line")
-    fig5 = px.bar(group_product,
-                x="Product line",
-                y="Total",
-                title="Total Sales per Product Line",
-                labels={"Total": "Total Sales"},
-                template="plotly_white")
-    st.plotly_chart(fig5, use_container_width=True)
-    st.caption('Food and beverages have the most sales in comparison to the health and Beauty')
-
-    st.subheader("Quantity by Gender")
-    fig6 = px.pie(group_gender_quantity,
-                names="Gender",
-                values="Quantity",
-                title="Quantity Sold by Gender",
-                template="plotly_white")
-    st.plotly_chart(fig6, use_container_width=True)
-    st.caption("Females have a high quantity threshold in comparison to males")
-
-    st.subheader("Quantity by Product Line")
-    fig7 = px.bar(group_product_line_quantity,
-                x="Product line",
-                y="Quantity",
-                title="Total Quantity Sold per Product Line",
-                labels={"Quantity": "Quantity"},
-                template="plotly_white")
-    st.plotly_chart(fig7, use_container_width=True)
-
-    st.subheader("Average Rating by Product Line")
-    fig8 = px.bar(group_rating_per_products,
-                x="Product line",
-                y="Rating",
-                title="Average Rating per Product Line",
-                labels={"Rating": "Average Rating"},
-                template="plotly_white")
-    st.plotly_chart(fig8, use_container_width=True)
-    st.caption('We maintain general user satisfaction on all the products')
-
-    st.subheader("Average Tax by Gender")
-    fig9 = px.bar(group_taxes_per_gender,
-                x="Gender",
-                y="Tax 5%",
-                title="Average Tax Paid by Gender",
-                labels={"Tax 5%": "Avg Tax"},
-                template="plotly_white")
-    st.plotly_chart(fig9, use_container_width=True)
-    st.caption('Females may be in a higher tax bracket compared to males')
-
-    st.subheader("Average Tax by Product Line")
-    fig10 = px.bar(group_taxes_per_product_line,
-                x="Product line", y="Tax 5%",
-                title="Average Tax Paid by Product Line",
-                labels={"Tax 5%": "Avg Tax"},
-                template="plotly_white")
-    st.plotly_chart(fig10, use_container_width=True)
-    st.caption("We observe that the home and lifestyle category under products is taxed slightly higher while fashion is lower")
-
-    st.subheader("Average Gross Income by Product Line")
-    fig11 = px.bar(group_products_per_gross_income,
-                x="Product line", y="gross income",
-                title="Avg Gross Income per Product Line",
-                labels={"gross income": "Gross Income"},
-                template="plotly_white")
-    st.plotly_chart(fig11, use_container_width=True)
+    for spec in shown:
+        st.subheader(spec.subheader)
+        st.plotly_chart(figures[spec.fig_id], use_container_width=True)
+        for caption in spec.captions:
+            st.caption(caption)
 
 elif page == "ML Predictions":
     st.header("Machine Learning Predictions")
@@ -292,8 +198,8 @@ elif page == "ML Predictions":
     clf_model_path = MODELS_DIR / "Random_forest_classifier_model.pkl"
 
     try:
-        reg_model = joblib.load(reg_model_path)
-        clf_model = joblib.load(clf_model_path)
+        reg_model = load_model(reg_model_path)
+        clf_model = load_model(clf_model_path)
     except:
         st.error("Models not found. Train and save them first.")
         st.stop()
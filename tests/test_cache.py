@@ -0,0 +1,79 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from Supermarket_sales.modeling.cache import CachedModel
+
+
+class CountingModel:
+    """Predicts scale * row sum and records how many rows it scored."""
+
+    def __init__(self, scale):
+        self.scale = scale
+        self.scored = 0
+
+    def predict(self, X):
+        self.scored += len(X)
+        return X.sum(axis=1).to_numpy() * self.scale
+
+
+def save_model(path, scale):
+    joblib.dump(CountingModel(scale), path)
+    # Make the rewrite visible even on filesystems with coarse mtimes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def X():
+    return pd.DataFrame({"a": [1, 2, 1, 3, 1], "b": [0, 0, 0, 1, 0]})
+
+
+def test_duplicate_rows_are_scored_once(tmp_path, X):
+    save_model(tmp_path / "model.pkl", 1)
+    model = CachedModel(tmp_path / "model.pkl")
+
+    np.testing.assert_array_equal(model.predict(X), [1, 2, 1, 4, 1])
+    assert model.model.scored == 3
+    assert (model.hits, model.misses) == (2, 3)
+
+    np.testing.assert_array_equal(model.predict(X), [1, 2, 1, 4, 1])
+    assert model.model.scored == 3
+    assert (model.hits, model.misses) == (7, 3)
+
+
+def test_disk_store_is_shared_between_instances(tmp_path, X):
+    save_model(tmp_path / "model.pkl", 1)
+    CachedModel(tmp_path / "model.pkl", cache_dir=tmp_path / "cache").predict(X)
+
+    model = CachedModel(tmp_path / "model.pkl", cache_dir=tmp_path / "cache")
+    np.testing.assert_array_equal(model.predict(X), [1, 2, 1, 4, 1])
+    assert model.model.scored == 0
+    assert len(list((tmp_path / "cache").glob("model-*.npz"))) == 1
+
+
+def test_retrained_artifact_invalidates_cache(tmp_path, X):
+    save_model(tmp_path / "model.pkl", 1)
+    model = CachedModel(tmp_path / "model.pkl", cache_dir=tmp_path / "cache")
+    model.predict(X)
+    old_store = model._store_path()
+
+    save_model(tmp_path / "model.pkl", 10)
+    np.testing.assert_array_equal(model.predict(X), [10, 20, 10, 40, 10])
+    assert model.model.scored == 3
+    assert not old_store.exists()
+    assert list((tmp_path / "cache").glob("model-*.npz")) == [model._store_path()]
+
+
+def test_disk_store_is_capped(tmp_path):
+    save_model(tmp_path / "model.pkl", 1)
+    model = CachedModel(tmp_path / "model.pkl", cache_dir=tmp_path / "cache", max_disk_entries=4)
+    model.predict(pd.DataFrame({"a": range(3)}))
+    model.predict(pd.DataFrame({"a": range(3, 6)}))
+
+    with np.load(model._store_path()) as store:
+        assert len(store["keys"]) == 4
+        np.testing.assert_array_equal(store["values"], [2, 3, 4, 5])
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from Supermarket_sales import report
+from Supermarket_sales.stats import KPIStats, TDigest, compute_kpis
+
+
+def make_sales(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "Total": rng.lognormal(5, 1, n),
+            "Quantity": rng.integers(1, 11, n),
+            "Rating": rng.uniform(4, 10, n).round(1),
+        }
+    )
+
+
+def chunks(df, size):
+    return (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+def partitions(df, k):
+    bounds = np.linspace(0, len(df), k + 1).astype(int)
+    return [df.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:], strict=True)]
+
+
+def assert_matches_pandas(summary, df, quantile_rtol=0.0):
+    expected = df[list(summary.index)]
+    np.testing.assert_allclose(summary["count"], expected.count())
+    np.testing.assert_allclose(summary["sum"], expected.sum())
+    np.testing.assert_allclose(summary["mean"], expected.mean())
+    np.testing.assert_allclose(summary["std"], expected.std())
+    np.testing.assert_allclose(summary["median"], expected.quantile(0.5), rtol=quantile_rtol)
+    np.testing.assert_allclose(summary["p95"], expected.quantile(0.95), rtol=quantile_rtol)
+
+
+@pytest.mark.parametrize("n", [200, 1000, 9000])
+def test_small_inputs_are_exact(n):
+    df = make_sales(n)
+    assert_matches_pandas(compute_kpis(chunks(df, 128)).summary(), df)
+
+
+def test_merged_partials_match_pandas():
+    df = make_sales(90_000)
+    partials = [compute_kpis(chunks(part, 7_000)) for part in partitions(df, 3)]
+    stats = KPIStats()
+    for part in partials:
+        stats.merge(part)
+    summary = stats.summary()
+
+    # Total has too many distinct values to stay exact; the sketch is approximate there
+    assert_matches_pandas(summary.loc[["Quantity", "Rating"]], df[["Quantity", "Rating"]])
+    assert_matches_pandas(summary.loc[["Total"]], df[["Total"]], quantile_rtol=0.02)
+
+
+def test_integer_quantiles_stay_exact_past_the_buffer():
+    values = np.random.default_rng(1).integers(1, 11, 90_000)
+    digest = TDigest()
+    for part in np.array_split(values, 9):
+        digest.merge(TDigest().update(part))
+    assert digest.exact
+    assert digest.quantile(0.5) == np.median(values)
+    assert digest.quantile(0.95) == np.quantile(values, 0.95)
+
+
+def test_merging_an_empty_digest_keeps_exact_answers():
+    values = np.arange(1.0, 12.0)
+    digest = TDigest().update(values)
+    digest.merge(TDigest())
+    assert digest.exact
+    assert digest.quantile(0.5) == np.median(values)
+    assert np.isnan(TDigest().quantile(0.5))
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_report_agrees_with_numpy_on_integer_data(tmp_path, workers):
+    df = make_sales(90_000, seed=2)
+    paths = [tmp_path / "empty.csv"]
+    df.iloc[:0].to_csv(paths[0], index=False)
+    for i, part in enumerate(partitions(df, 3)):
+        paths.append(tmp_path / f"part{i}.csv")
+        part.to_csv(paths[-1], index=False)
+
+    output_path = tmp_path / "kpis.csv"
+    report.main(paths, output_path=output_path, chunksize=10_000, workers=workers)
+    summary = pd.read_csv(output_path, index_col="column")
+
+    assert summary.loc["Quantity", "count"] == len(df)
+    assert summary.loc["Quantity", "median"] == np.median(df["Quantity"])
+    assert summary.loc["Quantity", "p95"] == np.quantile(df["Quantity"], 0.95)
+    assert summary.loc["Total", "sum"] == pytest.approx(df["Total"].sum())